@@ -27,11 +27,15 @@ def run():
 
     from PySide6 import QtCore, QtWidgets
 
+    import multiprocessing
     import sys
 
     from .app import skin
     from .main import Main
 
+    # Workers get a clean interpreter however the GUI is launched
+    multiprocessing.set_start_method('spawn', force=True)
+
     app = QtWidgets.QApplication(sys.argv)
     app.setStyle('Fusion')
     skin.apply(app)
@@ -18,15 +18,22 @@
 
 """File checking and parsing"""
 
+from functools import lru_cache
 from pathlib import Path
+import os
 
 from .types import TaxonRank, GapsAsCharacters, ScoringThreshold
 
 
 def is_fasta(path):
-    with open(path) as file:
-        char = file.read(1)
-        return char == '>'
+    """Check if the first byte is '>', as expected by check_sequence_file"""
+    return _is_fasta_cached(str(path), os.path.getmtime(path))
+
+
+@lru_cache(maxsize=64)
+def _is_fasta_cached(path, mtime):
+    with open(path, 'rb') as file:
+        return file.read(1) == b'>'
 
 def check_sequence_file(path):
     error_caption = 'Error opening sequence file: \n'
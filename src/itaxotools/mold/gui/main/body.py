@@ -57,21 +57,22 @@ class Body(QtWidgets.QStackedWidget):
         area.ensureVisible(0, 0)
 
         self.binder.unbind_all()
+        self.binder.bind_many([
+            (self.actions.open.triggered, view.open),
+            (self.actions.open_sequences.triggered, view.openSequence),
+            (self.actions.open_configuration.triggered, view.openConfiguration),
+            (self.actions.save.triggered, view.save),
+            (self.actions.start.triggered, view.start),
+            (self.actions.stop.triggered, view.stop),
+            (self.actions.clear.triggered, view.clear),
 
-        self.binder.bind(self.actions.open.triggered, view.open)
-        self.binder.bind(self.actions.open_sequences.triggered, view.openSequence)
-        self.binder.bind(self.actions.open_configuration.triggered, view.openConfiguration)
-        self.binder.bind(self.actions.save.triggered, view.save)
-        self.binder.bind(self.actions.start.triggered, view.start)
-        self.binder.bind(self.actions.stop.triggered, view.stop)
-        self.binder.bind(self.actions.clear.triggered, view.clear)
+            (object.properties.ready, self.actions.start.setEnabled),
+            (object.properties.editable, self.actions.start.setVisible),
+            (object.properties.busy, self.actions.stop.setVisible),
+            (object.properties.done, self.actions.save.setEnabled),
+            (object.properties.done, self.actions.clear.setVisible),
 
-        self.binder.bind(object.properties.ready, self.actions.start.setEnabled)
-        self.binder.bind(object.properties.editable, self.actions.start.setVisible)
-        self.binder.bind(object.properties.busy, self.actions.stop.setVisible)
-        self.binder.bind(object.properties.done, self.actions.save.setEnabled)
-        self.binder.bind(object.properties.done, self.actions.clear.setVisible)
-
-        self.binder.bind(object.properties.dirty_data, self.window().state.properties.dirty_data)
+            (object.properties.dirty_data, self.window().state.properties.dirty_data),
+        ])
 
         return True
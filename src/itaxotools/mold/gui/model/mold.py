@@ -18,10 +18,11 @@
 
 from PySide6 import QtCore
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from itertools import chain
 from pathlib import Path
-from shutil import copy
+from shutil import copyfile
 
 from ..files import check_sequence_file, parse_configuration_file
 from ..utility import Property, Instance, Binder, PropertyObject, EnumObject
@@ -106,6 +107,9 @@ class MoldModel(Task):
     def __init__(self, name=None):
         super().__init__(name)
 
+        self._suggested_key = None
+        self._suggested_paths = None
+
         self.textLogIO = WriterIO(self.lineLogged.emit)
         self.worker.streamOut.add(self.textLogIO)
         self.worker.streamErr.add(self.textLogIO)
@@ -272,37 +276,53 @@ class MoldModel(Task):
         self.pairs_mode = PairwiseSelectMode.List
         self.pairs_list = '\n'.join(pairs) + '\n'
 
+    def _get_suggested_paths(self):
+        """Only rebuilt when the sequence path or result id change"""
+        key = (self.sequence_path, self.result_id)
+        if key != self._suggested_key:
+            path = self.sequence_path
+            self._suggested_paths = (
+                path.parent / f'{path.stem}.molecular_diagnosis.html',
+                path.parent / f'{path.stem}.pairwise.html',
+                path.parent / f'{path.stem}.{self.result_id}.log',
+                path.parent,
+            )
+            self._suggested_key = key
+        return self._suggested_paths
+
     @property
     def suggested_diagnosis(self):
-        path = self.sequence_path
-        return path.parent / f'{path.stem}.molecular_diagnosis.html'
+        return self._get_suggested_paths()[0]
 
     @property
     def suggested_pairwise(self):
-        path = self.sequence_path
-        return path.parent / f'{path.stem}.pairwise.html'
+        return self._get_suggested_paths()[1]
 
     @property
     def suggested_log(self):
-        path = self.sequence_path
-        return path.parent / f'{path.stem}.{self.result_id}.log'
+        return self._get_suggested_paths()[2]
 
     @property
     def suggested_directory(self):
-        path = self.sequence_path
-        return path.parent
+        return self._get_suggested_paths()[3]
 
     def save_diagnosis(self, path):
-        copy(self.result_diagnosis, path)
+        copyfile(self.result_diagnosis, path)
 
     def save_pairwise(self, path):
-        copy(self.result_pairwise, path)
+        copyfile(self.result_pairwise, path)
 
     def save_log(self, path):
-        copy(self.temporary_path / f'{self.result_id}.log', path)
+        copyfile(self.temporary_path / f'{self.result_id}.log', path)
 
     def save_all(self, path):
-        self.save_diagnosis(path / self.suggested_diagnosis.name)
-        self.save_pairwise(path / self.suggested_pairwise.name)
-        self.save_log(path / self.suggested_log.name)
+        # The copies are independent, so let them overlap
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.save_diagnosis, path / self.suggested_diagnosis.name),
+                executor.submit(self.save_pairwise, path / self.suggested_pairwise.name),
+                executor.submit(self.save_log, path / self.suggested_log.name),
+            ]
+        for future in futures:
+            future.result()
         self.dirty_data = False
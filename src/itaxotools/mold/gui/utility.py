@@ -20,7 +20,7 @@ from PySide6 import QtCore
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Callable, ClassVar, Optional, Union, NamedTuple, Type
+from typing import Callable, ClassVar, Iterable, Optional, Tuple, Union, NamedTuple, Type
 
 
 class Instance:
@@ -297,13 +297,19 @@ class Binder(set):
         else:
             slot = destination
 
-        key = Binding._unbind(signal, slot)
+        Binding._unbind(signal, slot)
 
-        self.remove(key)
+        self.remove(Binding(signal, slot))
+
+    def bind_many(self, bindings: Iterable[Tuple]):
+        """Bind each (source, destination[, proxy]) tuple in order"""
+        bind = self.bind
+        for binding in bindings:
+            bind(*binding)
 
     def unbind_all(self):
         for key in self:
-            unbind(key.signal, key.slot)
+            Binding._unbind(key.signal, key.slot)
         self.clear()
 
 
@@ -29,6 +29,13 @@ from ..utility import Guard, Binder
 from ..types import Notification
 
 
+# Avoid probing icons for every entry of large or remote folders
+_DIALOG_OPTIONS = (
+    QtWidgets.QFileDialog.DontUseCustomDirectoryIcons |
+    QtWidgets.QFileDialog.HideNameFilterDetails
+)
+
+
 class ObjectView(QtWidgets.QFrame):
 
     def __init__(self, *args, **kwargs):
@@ -36,6 +43,8 @@ class ObjectView(QtWidgets.QFrame):
         self.setStyleSheet("""ObjectView{background: Palette(Dark);}""")
         self.binder = Binder()
         self.object = None
+        self._last_dir = ''
+        self._last_save_dir = ''
 
     def setObject(self, object: Object):
         self.object = object
@@ -59,23 +68,35 @@ class ObjectView(QtWidgets.QFrame):
 
     def getOpenPath(self, caption='Open File', dir='', filter=''):
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self.window(), f'{app.title} - {caption}', dir, filter=filter)
+            self.window(), f'{app.title} - {caption}', dir or self._last_dir,
+            filter=filter, options=_DIALOG_OPTIONS | QtWidgets.QFileDialog.ReadOnly)
         if not filename:
             return None
-        return Path(filename)
+        path = Path(filename)
+        self._last_dir = str(path.parent)
+        return path
 
     def getSavePath(self, caption='Open File', dir=''):
+        if dir and self._last_save_dir:
+            # Keep the suggested filename, but open where we last saved
+            dir = str(Path(self._last_save_dir) / Path(dir).name)
         filename, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self.window(), f'{app.title} - {caption}', dir)
+            self.window(), f'{app.title} - {caption}', dir or self._last_dir,
+            options=_DIALOG_OPTIONS)
         if not filename:
             return None
-        return Path(filename)
+        path = Path(filename)
+        self._last_dir = str(path.parent)
+        self._last_save_dir = self._last_dir
+        return path
 
     def getExistingDirectory(self, caption='Open File', dir=''):
         filename = QtWidgets.QFileDialog.getExistingDirectory(
-            self.window(), f'{app.title} - {caption}', dir)
+            self.window(), f'{app.title} - {caption}', dir or self._last_dir,
+            options=_DIALOG_OPTIONS | QtWidgets.QFileDialog.ShowDirsOnly)
         if not filename:
             return None
+        self._last_dir = filename
         return Path(filename)
 
     def getConfirmation(self, title='Confirmation', text='Are you sure?'):
@@ -167,6 +188,8 @@ class GLineEdit(QtWidgets.QLineEdit):
     def setText(self, text):
         if self._guard:
             return
+        if self.text() == text:
+            return
         super().setText(text)
 
 
@@ -187,6 +210,8 @@ class GTextEdit(QtWidgets.QPlainTextEdit):
     def setText(self, text):
         if self._guard:
             return
+        if self.toPlainText() == text:
+            return
         super().setPlainText(text)
 
 
@@ -214,6 +239,23 @@ class GSpinBox(QtWidgets.QSpinBox):
         event.ignore()
 
 
+class HeadingLabel(QtWidgets.QLabel):
+    """Larger label text, set as a shared font instead of a stylesheet"""
+    _font = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setFont(self.headingFont(self))
+
+    @classmethod
+    def headingFont(cls, widget):
+        if cls._font is None:
+            font = QtGui.QFont(widget.font())
+            font.setPixelSize(16)
+            cls._font = font
+        return cls._font
+
+
 class LongLabel(QtWidgets.QLabel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -246,23 +288,26 @@ class RadioButtonGroup(QtCore.QObject):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.group = QtWidgets.QButtonGroup(self)
+        self.group.idToggled.connect(self.handleToggle)
         self.members = dict()
         self.value = None
 
     def add(self, widget, value):
-        self.members[widget] = value
-        widget.toggled.connect(self.handleToggle)
+        id = len(self.members)
+        self.members[id] = value
+        self.group.addButton(widget, id)
 
-    def handleToggle(self, checked):
+    def handleToggle(self, id, checked):
         if not checked:
             return
-        self.value = self.members[self.sender()]
+        self.value = self.members[id]
         self.valueChanged.emit(self.value)
 
     def setValue(self, newValue):
         self.value = newValue
-        for widget, value in self.members.items():
-            widget.setChecked(value == newValue)
+        for id, value in self.members.items():
+            self.group.button(id).setChecked(value == newValue)
 
 
 class NoWheelRadioButton(QtWidgets.QRadioButton):
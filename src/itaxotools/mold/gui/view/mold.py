@@ -20,6 +20,7 @@ from PySide6 import QtCore, QtWidgets, QtGui
 
 from pathlib import Path
 from collections import defaultdict
+from itertools import chain
 
 from itaxotools.common.utility import AttrDict, override
 from itaxotools.common.widgets import VLineSeparator
@@ -28,28 +29,105 @@ from .. import app
 from ..types import TaxonSelectMode, PairwiseSelectMode, TaxonRank, ScoringThreshold, GapsAsCharacters, AdvancedMDNCProperties, AdvancedRDNSProperties, ConfigurationMode
 from ..files import is_fasta
 from ..utility import type_convert
-from .common import Card, TaskView, GLineEdit, GTextEdit, NoWheelComboBox, NoWheelRadioButton, LongLabel, RadioButtonGroup, RichRadioButton, SpinningCircle, CategoryButton
+from .common import Card, TaskView, GLineEdit, GTextEdit, NoWheelComboBox, NoWheelRadioButton, HeadingLabel, LongLabel, RadioButtonGroup, RichRadioButton, SpinningCircle, CategoryButton
+
+
+_BADGE_STYLE = """font-size: 16px; color: Palette(Shadow);"""
+_CITATIONS_STYLE = """LongLabel {color: Palette(Dark)}"""
+_VIEW_STYLE = """
+    QLineEdit#pathEdit {
+        background-color: palette(Base);
+        padding: 2px 4px 2px 4px;
+        border-radius: 4px;
+        border: 1px solid palette(Mid);
+        }
+    """
+
+
+def _not(x):
+    return not x
+
+
+def _to_int_or_none(x):
+    return type_convert(x, int, None)
+
+
+def _to_str_or_empty(x):
+    return '' if x is None else str(x)
+
+
+def _text_edit_bindings(edit, property):
+    return [
+        (edit.textEditedSafe, property),
+        (property, edit.setText),
+    ]
+
+
+def _int_edit_bindings(edit, property):
+    return [
+        (edit.textCommitted, property, _to_int_or_none),
+        (property, edit.setText, _to_str_or_empty),
+    ]
 
 
 class GrowingTextEdit(GTextEdit):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._size_hint = None
+        self._size_hint_lines = None
+        self._last_lines = None
         self.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-        self.document().contentsChanged.connect(self.updateGeometry)
         self.height_slack = 16
         self.lines_max = 8
+        self._updateLineHeight()
+
+        self._layoutTimer = QtCore.QTimer(self)
+        self._layoutTimer.setSingleShot(True)
+        self._layoutTimer.setInterval(50)
+        self._layoutTimer.timeout.connect(self._maybeUpdateGeometry)
+        self.document().contentsChanged.connect(self._layoutTimer.start)
+
+    def _maybeUpdateGeometry(self):
+        # Only relayout when the number of visible lines changes
+        lines = self.getVisibleLines()
+        if lines == self._last_lines:
+            return
+        self._last_lines = lines
+        self._size_hint = None
+        self.updateGeometry()
+
+    @override
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.FontChange:
+            self._updateLineHeight()
+        if event.type() in (QtCore.QEvent.FontChange, QtCore.QEvent.StyleChange):
+            self._size_hint = None
+
+    def _updateLineHeight(self):
+        self._line_height = self.fontMetrics().height()
+        self._max_height = self.lines_max * self._line_height
+
+    def getVisibleLines(self):
+        # Lines never wrap, so each block is exactly one line
+        return min(self.document().blockCount(), self.lines_max)
 
     def getHeightHint(self):
-        lines = self.document().size().height()
-        lines = min(lines, self.lines_max)
-        height = self.fontMetrics().height()
-        return int(lines * height)
+        lines = self.getVisibleLines()
+        if lines >= self.lines_max:
+            return self._max_height
+        return lines * self._line_height
 
+    @override
     def sizeHint(self):
-        width = super().sizeHint().width()
-        height = self.getHeightHint() + 16
-        return QtCore.QSize(width, height)
+        lines = self.getVisibleLines()
+        if self._size_hint is None or self._size_hint_lines != lines:
+            width = super().sizeHint().width()
+            height = self.getHeightHint() + 16
+            self._size_hint = QtCore.QSize(width, height)
+            self._size_hint_lines = lines
+        return self._size_hint
 
 
 class TextEditLogger(QtWidgets.QPlainTextEdit):
@@ -57,18 +135,23 @@ class TextEditLogger(QtWidgets.QPlainTextEdit):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setReadOnly(True)
-        self.scrollbarOldValue = 0
-        self.scrollbarAtBottom = True
-        self.scrollbarAtTop = True
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(5000)
+        self.pending = []
+        self.flushTimer = QtCore.QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(30)
+        self.flushTimer.timeout.connect(self.flush)
         self.scrollbarLock = True
         self.scrollbarLockTimer = QtCore.QTimer()
         self.scrollbarLockTimer.timeout.connect(self.scrollbarUnlock)
         self.scrollbarLockTimer.setSingleShot(True)
-        self.verticalScrollBar().valueChanged.connect(self.checkScrollbar)
 
     def wheelEvent(self, event):
         super().wheelEvent(event)
-        if self.scrollbarAtBottom or self.scrollbarAtTop:
+        scrollbar = self.verticalScrollBar()
+        value = scrollbar.value()
+        if value == scrollbar.maximum() or value == scrollbar.minimum():
             if not self.scrollbarLockTimer.isActive():
                 self.scrollbarLockTimer.start(300)
             if self.scrollbarLock:
@@ -81,30 +164,61 @@ class TextEditLogger(QtWidgets.QPlainTextEdit):
         self.scrollbarLock = False
 
     def append(self, text):
-        self.moveCursor(QtGui.QTextCursor.End)
-        self.insertPlainText(text)
-        self.moveCursor(QtGui.QTextCursor.End)
+        """Text is buffered and written out in bursts by flush()"""
+        self.pending.append(text)
+        if not self.flushTimer.isActive():
+            self.flushTimer.start()
 
-        if not self.scrollbarAtBottom:
-            self.verticalScrollBar().setValue(self.scrollbarOldValue)
+    def flush(self):
+        if not self.pending:
+            return
+        text = ''.join(self.pending)
+        self.pending.clear()
 
-    def checkScrollbar(self, value):
+        # Sample the scrollbar once per burst instead of tracking every move
         scrollbar = self.verticalScrollBar()
-        self.scrollbarOldValue = value
-        self.scrollbarAtBottom = scrollbar.value() == scrollbar.maximum()
-        self.scrollbarAtTop = scrollbar.value() == 0
+        value = scrollbar.value()
+        at_bottom = value == scrollbar.maximum()
+
+        cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertText(text)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            scrollbar.setValue(value)
+
+    @override
+    def clear(self):
+        self.flushTimer.stop()
+        self.pending.clear()
+        super().clear()
 
 
 class TitleCard(Card):
     run = QtCore.Signal()
     cancel = QtCore.Signal()
 
+    description_text = app.description
+    citations_text = app.citations
+    button_width = 100
+    _manual_url = None
+    button_slots = (
+        ('Manual', 'openManual'),
+        ('Homepage', 'openHomepage'),
+        ('Galaxy', 'openGalaxy'),
+        ('iTaxoTools', 'openItaxotools'),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        description = LongLabel(app.description)
-        citations = LongLabel(app.citations)
-        citations.setStyleSheet("LongLabel {color: Palette(Dark)}")
+        description = LongLabel(self.description_text)
+        description.setTextFormat(QtCore.Qt.PlainText)
+        citations = LongLabel(self.citations_text)
+        citations.setTextFormat(QtCore.Qt.PlainText)
+        citations.setStyleSheet(_CITATIONS_STYLE)
 
         contents = QtWidgets.QVBoxLayout()
         contents.addWidget(description)
@@ -112,22 +226,14 @@ class TitleCard(Card):
         contents.addStretch(1)
         contents.setSpacing(12)
 
-        manual = QtWidgets.QPushButton('Manual')
-        homepage = QtWidgets.QPushButton('Homepage')
-        galaxy = QtWidgets.QPushButton('Galaxy')
-        itaxotools = QtWidgets.QPushButton('iTaxoTools')
-        itaxotools.setFixedWidth(100)
-
-        manual.clicked.connect(self.openManual)
-        homepage.clicked.connect(self.openHomepage)
-        galaxy.clicked.connect(self.openGalaxy)
-        itaxotools.clicked.connect(self.openItaxotools)
-
+        self.controls.buttons = dict()
         buttons = QtWidgets.QVBoxLayout()
-        buttons.addWidget(manual)
-        buttons.addWidget(homepage)
-        buttons.addWidget(galaxy)
-        buttons.addWidget(itaxotools)
+        for text, slot in self.button_slots:
+            button = QtWidgets.QPushButton(text)
+            button.setFixedWidth(self.button_width)
+            button.clicked.connect(getattr(self, slot))
+            buttons.addWidget(button)
+            self.controls.buttons[text] = button
         buttons.addStretch(1)
         buttons.setSpacing(8)
 
@@ -141,8 +247,9 @@ class TitleCard(Card):
         self.addLayout(layout)
 
     def openManual(self):
-        url = QtCore.QUrl.fromLocalFile(str(app.resources.docs.manual))
-        QtGui.QDesktopServices.openUrl(url)
+        if TitleCard._manual_url is None:
+            TitleCard._manual_url = QtCore.QUrl.fromLocalFile(str(app.resources.docs.manual))
+        QtGui.QDesktopServices.openUrl(TitleCard._manual_url)
 
     def openHomepage(self):
         QtGui.QDesktopServices.openUrl(app.homepage_url)
@@ -161,21 +268,27 @@ class ProgressCard(Card):
         super().__init__(parent)
         self._success = False
         self._busy = False
+        self._logger = None
 
+        self.setUpdatesEnabled(False)
+        try:
+            self.draw()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def draw(self):
         check = QtWidgets.QLabel('\u2714')
-        check.setStyleSheet("""font-size: 16px; color: Palette(Shadow);""")
+        check.setStyleSheet(_BADGE_STYLE)
 
         cross = QtWidgets.QLabel('\u2718')
-        cross.setStyleSheet("""font-size: 16px; color: Palette(Shadow);""")
+        cross.setStyleSheet(_BADGE_STYLE)
 
         spin = SpinningCircle()
         spin.radius = 7
 
-        wait = QtWidgets.QLabel('Diagnosing sequences, please hold on...')
-        wait.setStyleSheet("""font-size: 16px;""")
+        wait = HeadingLabel('Diagnosing sequences, please hold on...')
 
-        done = QtWidgets.QLabel('Progress Logs')
-        done.setStyleSheet("""font-size: 16px;""")
+        done = HeadingLabel('Progress Logs')
 
         save = QtWidgets.QPushButton('Save')
         save.clicked.connect(self.save)
@@ -196,23 +309,9 @@ class ProgressCard(Card):
         head.addSpacing(4)
         head.addWidget(details)
 
-        bar = QtWidgets.QProgressBar()
-        bar.setMaximum(0)
-        bar.setMinimum(0)
-        bar.setValue(0)
-        bar.setVisible(False)
-
-        layout = QtWidgets.QVBoxLayout()
-        layout.setSpacing(8)
-        layout.addLayout(head)
-        layout.addWidget(bar)
-
-        logger = TextEditLogger()
+        self.addLayout(head)
 
-        self.addLayout(layout)
-        self.addWidget(logger)
-
-        details.toggled.connect(logger.setVisible)
+        details.toggled.connect(self.setLoggerVisible)
 
         self.controls.check = check
         self.controls.cross = cross
@@ -221,8 +320,26 @@ class ProgressCard(Card):
         self.controls.done = done
         self.controls.details = details
         self.controls.save = save
-        self.controls.bar = bar
-        self.controls.logger = logger
+
+    @property
+    def logger(self):
+        """The logger is only created once there is something to log"""
+        if self._logger is None:
+            self._logger = TextEditLogger(self)
+            self.addWidget(self._logger)
+            self._logger.setVisible(self.controls.details.isChecked())
+        return self._logger
+
+    def setLoggerVisible(self, visible):
+        if self._logger is not None:
+            self._logger.setVisible(visible)
+
+    def appendLog(self, text):
+        self.logger.append(text)
+
+    def clearLogs(self):
+        if self._logger is not None:
+            self._logger.clear()
 
     def setBusy(self, busy):
         self._busy = busy
@@ -231,7 +348,6 @@ class ProgressCard(Card):
         self.controls.wait.setVisible(busy)
         self.controls.details.setChecked(busy)
         self.controls.save.setVisible(not busy)
-        # self.controls.bar.setVisible(busy)
         self.updateBadge()
 
     def setSuccess(self, success):
@@ -262,8 +378,7 @@ class ConfigSelector(Card):
         self.controls.mode.setValue(self.modes.Fields)
 
     def draw_modes(self):
-        label = QtWidgets.QLabel(self.mode_text + ':')
-        label.setStyleSheet("""font-size: 16px;""")
+        label = HeadingLabel(self.mode_text + ':')
         label.setFixedWidth(134)
 
         group = RadioButtonGroup()
@@ -288,21 +403,13 @@ class ConfigSelector(Card):
         self.addLayout(layout)
 
     def draw_selector(self):
-        label = QtWidgets.QLabel(self.label_text + ':')
-        label.setStyleSheet("""font-size: 16px;""")
+        label = HeadingLabel(self.label_text + ':')
         label.setFixedWidth(134)
 
         filename = GLineEdit()
         filename.setReadOnly(True)
         filename.setPlaceholderText(self.placeholder_text)
-        filename.setStyleSheet("""
-            QLineEdit {
-                background-color: palette(Base);
-                padding: 2px 4px 2px 4px;
-                border-radius: 4px;
-                border: 1px solid palette(Mid);
-                }
-            """)
+        filename.setObjectName('pathEdit')
 
         browse = QtWidgets.QPushButton('Browse')
         browse.clicked.connect(self.browse)
@@ -333,12 +440,10 @@ class ConfigSelector(Card):
         self.controls.selector.setVisible(mode.has_file)
 
     def setPath(self, path):
-        if path is None:
-            self.controls.filename.setText('')
-            self.controls.mode.setValue(self.modes.Fields)
-        else:
-            self.controls.filename.setText(str(path))
-            self.controls.mode.setValue(self.modes.File)
+        mode = self.modes.Fields if path is None else self.modes.File
+        self.controls.filename.setText(_to_str_or_empty(path))
+        if self.controls.mode.value != mode:
+            self.controls.mode.setValue(mode)
 
 
 class SequenceSelector(Card):
@@ -349,21 +454,13 @@ class SequenceSelector(Card):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        label = QtWidgets.QLabel(self.label_text + ':')
-        label.setStyleSheet("""font-size: 16px;""")
+        label = HeadingLabel(self.label_text + ':')
         label.setFixedWidth(134)
 
         filename = GLineEdit()
         filename.setReadOnly(True)
         filename.setPlaceholderText(self.placeholder_text)
-        filename.setStyleSheet("""
-            QLineEdit {
-                background-color: palette(Base);
-                padding: 2px 4px 2px 4px;
-                border-radius: 4px;
-                border: 1px solid palette(Mid);
-                }
-            """)
+        filename.setObjectName('pathEdit')
 
         browse = QtWidgets.QPushButton('Browse')
         browse.clicked.connect(self.browse)
@@ -380,14 +477,12 @@ class SequenceSelector(Card):
         self.controls.browse = browse
 
     def setPath(self, path):
-        if path is None:
-            self.controls.filename.setText('')
-        else:
-            self.controls.filename.setText(str(path))
+        self.controls.filename.setText(_to_str_or_empty(path))
 
 
 class ModeSelector(Card):
     toggled = QtCore.Signal(object)
+    listEdited = QtCore.Signal(str)
 
     modes = []
     mode_text = 'Mode selection'
@@ -396,12 +491,13 @@ class ModeSelector(Card):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._list_text = ''
+        self.controls.section_list = None
+        self.controls.list = None
         self.draw_modes()
-        self.draw_list()
 
     def draw_modes(self):
-        label = QtWidgets.QLabel(self.mode_text + ':')
-        label.setStyleSheet("""font-size: 16px;""")
+        label = HeadingLabel(self.mode_text + ':')
         label.setFixedWidth(134)
 
         group = RadioButtonGroup()
@@ -431,6 +527,8 @@ class ModeSelector(Card):
 
         list = GrowingTextEdit()
         list.setPlaceholderText(self.list_placeholder)
+        list.setText(self._list_text)
+        list.textEditedSafe.connect(self.handleListEdited)
 
         layout = QtWidgets.QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -438,7 +536,7 @@ class ModeSelector(Card):
         layout.addWidget(label)
         layout.addWidget(list, 1)
 
-        widget = QtWidgets.QWidget()
+        widget = QtWidgets.QWidget(self)
         widget.setLayout(layout)
         self.addWidget(widget)
 
@@ -446,11 +544,29 @@ class ModeSelector(Card):
         self.controls.list = list
 
     def setMode(self, mode):
+        if self.controls.mode.value == mode:
+            return
         self.controls.mode.setValue(mode)
-        QtCore.QTimer.singleShot(10, self.update)
+
+    def setListVisible(self, visible):
+        """The list section is only drawn once it is first needed"""
+        if self.controls.section_list is None:
+            if not visible:
+                return
+            self.draw_list()
+        self.controls.section_list.setVisible(visible)
+
+    def setListText(self, text):
+        self._list_text = text
+        if self.controls.list is not None:
+            self.controls.list.setText(text)
+
+    def handleListEdited(self, text):
+        self._list_text = text
+        self.listEdited.emit(text)
 
     def handleToggle(self, mode):
-        self.controls.section_list.setVisible(True)
+        self.setListVisible(True)
 
 
 class TaxonSelector(ModeSelector):
@@ -472,7 +588,7 @@ class TaxonSelector(ModeSelector):
         super().__init__(parent)
 
     def handleToggle(self, mode):
-        self.controls.section_list.setVisible(mode == TaxonSelectMode.List)
+        self.setListVisible(mode == TaxonSelectMode.List)
 
 
 class PairwiseSelector(ModeSelector):
@@ -492,7 +608,7 @@ class PairwiseSelector(ModeSelector):
         super().__init__(parent)
 
     def handleToggle(self, mode):
-        self.controls.section_list.setVisible(mode == PairwiseSelectMode.List)
+        self.setListVisible(mode == PairwiseSelectMode.List)
 
 
 class TaxonRankSelector(Card):
@@ -501,8 +617,7 @@ class TaxonRankSelector(Card):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        title = QtWidgets.QLabel('Taxon rank:')
-        title.setStyleSheet("font-size:16px;")
+        title = HeadingLabel('Taxon rank:')
 
         label = LongLabel(
             'Rank of the taxon designations in the sequence headers of the fasta input file. '
@@ -526,6 +641,8 @@ class TaxonRankSelector(Card):
         self.addLayout(layout)
 
     def setRank(self, rank):
+        if self.controls.rank.value == rank:
+            return
         self.controls.rank.setValue(rank)
 
 
@@ -535,8 +652,7 @@ class GapsAsCharactersSelector(Card):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        label = QtWidgets.QLabel("Code alignment gaps as characters:")
-        label.setStyleSheet("""font-size: 16px;""")
+        label = HeadingLabel("Code alignment gaps as characters:")
 
         group = RadioButtonGroup()
         group.valueChanged.connect(self.toggled)
@@ -554,25 +670,33 @@ class GapsAsCharactersSelector(Card):
         self.addLayout(layout)
 
     def setMode(self, mode):
+        if self.controls.gaps.value == mode:
+            return
         self.controls.gaps.setValue(mode)
 
 
 class ExpandableCard(Card):
+    contentsDrawn = QtCore.Signal()
+
     title = 'Expandable Card'
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._contents_enabled = True
+        self.controls.contents = None
+        self.updateTimer = QtCore.QTimer(self)
+        self.updateTimer.setSingleShot(True)
+        self.updateTimer.setInterval(10)
+        self.updateTimer.timeout.connect(self.update)
         self.draw_title()
-        self.draw_contents()
 
         self.controls.title.toggled.connect(self.handleToggled)
 
         self.controls.title.setChecked(False)
-        self.controls.contents.setVisible(False)
 
     def draw_title(self):
         title = CategoryButton(self.title)
-        title.setStyleSheet("""font-size: 16px;""")
+        title.setFont(HeadingLabel.headingFont(title))
         self.addWidget(title)
 
         self.controls.title = title
@@ -585,12 +709,28 @@ class ExpandableCard(Card):
 
         self.controls.contents = widget
 
+    def hasContents(self):
+        return self.controls.contents is not None
+
+    def ensureContents(self):
+        """Contents are only drawn when the card is first expanded"""
+        if self.hasContents():
+            return
+        self.draw_contents()
+        self.controls.contents.setEnabled(self._contents_enabled)
+        self.contentsDrawn.emit()
+
     def handleToggled(self, checked):
-        self.controls.contents.setVisible(checked)
-        QtCore.QTimer.singleShot(10, self.update)
+        if checked:
+            self.ensureContents()
+        if self.hasContents():
+            self.controls.contents.setVisible(checked)
+        self.updateTimer.start()
 
     def setContentsEnabled(self, enable):
-        self.controls.contents.setEnabled(enable)
+        self._contents_enabled = enable
+        if self.hasContents():
+            self.controls.contents.setEnabled(enable)
 
 
 class EntryEdit(GLineEdit):
@@ -599,23 +739,65 @@ class EntryEdit(GLineEdit):
         self.setPlaceholderText(str(entry.default))
 
 
+class DebouncedIntEdit(EntryEdit):
+    """Emits textCommitted once typing settles or editing is finished"""
+    textCommitted = QtCore.Signal(str)
+
+    delay = 150
+
+    def __init__(self, entry):
+        super().__init__(entry)
+        self.commitTimer = QtCore.QTimer(self)
+        self.commitTimer.setSingleShot(True)
+        self.commitTimer.setInterval(self.delay)
+        self.commitTimer.timeout.connect(self.commit)
+        self.textEditedSafe.connect(self.handleTextEdited)
+        self.editingFinished.connect(self.flush)
+
+    def handleTextEdited(self, text):
+        self.commitTimer.start()
+
+    def flush(self):
+        """Commit any pending edit right away"""
+        if self.commitTimer.isActive():
+            self.commitTimer.stop()
+            self.commit()
+
+    def commit(self):
+        with self._guard:
+            self.textCommitted.emit(self.text())
+
+
 class ExpandableEnumCard(ExpandableCard):
     title = 'Expandable Enum Card'
     enum = []
     widget_types = defaultdict(lambda: EntryEdit)
 
     def draw_contents(self):
+        self.setUpdatesEnabled(False)
+        try:
+            self.draw_entries()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def draw_entries(self):
         layout = QtWidgets.QGridLayout()
         layout.setContentsMargins(8, 0, 0, 0)
         layout.setColumnStretch(2, 1)
         layout.setSpacing(16)
 
+        bold = self.font()
+        bold.setBold(True)
+
         for row, entry in enumerate(self.enum):
-            label = QtWidgets.QLabel(f'<b>{entry.label}:</b>')
+            label = QtWidgets.QLabel(f'{entry.label}:')
+            label.setTextFormat(QtCore.Qt.PlainText)
+            label.setFont(bold)
             widget_type = self.widget_types[entry]
             edit = widget_type(entry)
             edit.setFixedWidth(100)
             description = QtWidgets.QLabel(f'{entry.description}.')
+            description.setTextFormat(QtCore.Qt.PlainText)
             layout.addWidget(label, row, 0)
             layout.addWidget(edit, row, 1)
             layout.addWidget(description, row, 2)
@@ -631,6 +813,12 @@ class ExpandableEnumCard(ExpandableCard):
 class MDNCSelector(ExpandableEnumCard):
     title = 'Advanced parameters for mDNC recovery'
     enum = AdvancedMDNCProperties
+    widget_types = defaultdict(lambda: EntryEdit, {
+        enum.Nucleotides: DebouncedIntEdit,
+        enum.Iterations: DebouncedIntEdit,
+        enum.MaxLen1: DebouncedIntEdit,
+        enum.MaxLen2: DebouncedIntEdit,
+    })
 
 
 class ScoringCombobox(NoWheelComboBox):
@@ -638,8 +826,10 @@ class ScoringCombobox(NoWheelComboBox):
 
     def __init__(self, entry, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for threshold in ScoringThreshold:
+        self._index_by_value = dict()
+        for index, threshold in enumerate(ScoringThreshold):
             self.addItem(threshold.label, threshold.value)
+            self._index_by_value[threshold] = index
         self.currentIndexChanged.connect(self.handleIndexChanged)
 
     def handleIndexChanged(self, index):
@@ -648,13 +838,15 @@ class ScoringCombobox(NoWheelComboBox):
         self.valueChanged.emit(value)
 
     def setValue(self, value):
-        index = self.findData(value, QtCore.Qt.UserRole)
+        index = self._index_by_value.get(value, -1)
+        if index == self.currentIndex():
+            return
         self.setCurrentIndex(index)
 
 
-class PdiffEdit(GLineEdit):
-    def __init__(self, entry, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+class PdiffEdit(DebouncedIntEdit):
+    def __init__(self, entry):
+        super().__init__(entry)
         self.setPlaceholderText('From taxon rank')
 
 
@@ -663,6 +855,7 @@ class RDNSSelector(ExpandableEnumCard):
     enum = AdvancedRDNSProperties
     widget_types = defaultdict(lambda: EntryEdit, {
         enum.Pdiff: PdiffEdit,
+        enum.NmaxSeq: DebouncedIntEdit,
         enum.Scoring: ScoringCombobox,
     })
 
@@ -676,11 +869,10 @@ class ResultViewer(Card):
         self.text = label_text
         self.path = None
 
-        label = QtWidgets.QLabel(label_text)
-        label.setStyleSheet("""font-size: 16px;""")
+        label = HeadingLabel(label_text)
 
         check = QtWidgets.QLabel('\u2714')
-        check.setStyleSheet("""font-size: 16px; color: Palette(Shadow);""")
+        check.setStyleSheet(_BADGE_STYLE)
 
         save = QtWidgets.QPushButton('Save')
         save.clicked.connect(self.handleSave)
@@ -702,8 +894,15 @@ class ResultViewer(Card):
         self.controls.view = view
         self.controls.save = save
 
+        self.setVisible(False)
+
     def setPath(self, path):
+        if path == self.path:
+            return
         self.path = path
+        # isHidden() also holds before the window is first shown
+        if self.isHidden() == (path is None):
+            return
         self.setVisible(path is not None)
 
     def handleView(self):
@@ -718,18 +917,17 @@ class ResultDialog(QtWidgets.QDialog):
 
     def __init__(self, text, path, parent):
         super().__init__(parent)
-        self.path = path
+        self.path = None
+        self._mtime = None
 
         self.setWindowFlag(QtCore.Qt.WindowMaximizeButtonHint, True)
-        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.setWindowTitle(app.title + ' - ' + text)
         self.resize(460, 680)
         self.setModal(True)
 
         viewer = QtWidgets.QTextBrowser()
         # viewer.setStyleSheet("""QTextBrowser{margin: 12px;}""")
-        with open(path) as file:
-            viewer.setHtml(file.read())
+        self.viewer = viewer
 
         save = QtWidgets.QPushButton('Save')
         save.clicked.connect(self.handleSave)
@@ -750,6 +948,21 @@ class ResultDialog(QtWidgets.QDialog):
         layout.addLayout(buttons)
 
         self.setLayout(layout)
+        self.setPath(path)
+
+    def setText(self, text):
+        self.setWindowTitle(app.title + ' - ' + text)
+
+    def setPath(self, path):
+        """Load the result file, reloading it only if it was written again"""
+        mtime = path.stat().st_mtime_ns
+        if path == self.path and mtime == self._mtime:
+            return
+        self.path = path
+        self._mtime = mtime
+        # MolD writes reports in the locale encoding without declaring a charset
+        with open(path) as file:
+            self.viewer.setHtml(file.read())
 
     def handleSave(self):
         self.save.emit(self.path)
@@ -765,127 +978,202 @@ class PairwiseViewer(ResultViewer):
         super().__init__('Pairwise analysis', parent)
 
 
+class _SniffSignals(QtCore.QObject):
+    done = QtCore.Signal(object, bool)
+
+
+class _SniffTask(QtCore.QRunnable):
+    """Check whether a file is fasta without blocking the GUI thread"""
+
+    def __init__(self, path):
+        super().__init__()
+        # Kept alive by MoldView until the result is delivered
+        self.setAutoDelete(False)
+        self.path = path
+        self.signals = _SniffSignals()
+
+    def run(self):
+        try:
+            result = is_fasta(self.path)
+        except OSError:
+            # Let the configuration parser report the error
+            result = False
+        self.signals.done.emit(self, result)
+
+
 class MoldView(TaskView):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.cards = None
+        self._sniff_tasks = set()
+        self._title_prefix = app.title + ' - '
+        self._title_pending = False
+        self._last_title = None
+        self._scrollbar = None
+        self._diagnosis_dialog = None
+        self._pairwise_dialog = None
         self.draw()
 
     def draw(self):
-        self.cards = AttrDict()
-        self.cards.title = TitleCard(self)
-        self.cards.diagnosis = DiagnosisViewer(self)
-        self.cards.pairwise = PairwiseViewer(self)
-        self.cards.progress = ProgressCard(self)
-        self.cards.configuration = ConfigSelector(self)
-        self.cards.sequence = SequenceSelector(self)
-        self.cards.taxa = TaxonSelector(self)
-        self.cards.pairs = PairwiseSelector(self)
-        self.cards.rank = TaxonRankSelector(self)
-        self.cards.gaps = GapsAsCharactersSelector(self)
-        self.cards.mdnc = MDNCSelector(self)
-        self.cards.rdns = RDNSSelector(self)
-
         layout = QtWidgets.QVBoxLayout()
-        for card in self.cards:
-            layout.addWidget(card)
         layout.addStretch(1)
         layout.setSpacing(8)
         layout.setContentsMargins(8, 8, 8, 8)
         self.setLayout(layout)
+        # Keep the background set by TaskView
+        self.setStyleSheet(self.styleSheet() + _VIEW_STYLE)
+
+    def _ensure_cards(self):
+        """Cards are only built once the view is shown or given an object"""
+        if self.cards is not None:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.cards = AttrDict()
+            self.cards.title = TitleCard(self)
+            self.cards.diagnosis = DiagnosisViewer(self)
+            self.cards.pairwise = PairwiseViewer(self)
+            self.cards.progress = ProgressCard(self)
+            self.cards.configuration = ConfigSelector(self)
+            self.cards.sequence = SequenceSelector(self)
+            self.cards.taxa = TaxonSelector(self)
+            self.cards.pairs = PairwiseSelector(self)
+            self.cards.rank = TaxonRankSelector(self)
+            self.cards.gaps = GapsAsCharactersSelector(self)
+            self.cards.mdnc = MDNCSelector(self)
+            self.cards.rdns = RDNSSelector(self)
+
+            layout = self.layout()
+            for index, card in enumerate(tuple(self.cards.values())):
+                layout.insertWidget(index, card)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @override
+    def showEvent(self, event):
+        self._ensure_cards()
+        super().showEvent(event)
 
     def setObject(self, object):
+        if self.object is object:
+            return
+        self._ensure_cards()
         self.object = object
         self.binder.unbind_all()
-
-        self.binder.bind(self.cards.configuration.browse, self.openConfiguration)
-        self.binder.bind(self.cards.sequence.browse, self.openSequence)
-
-        for card in [
-            self.cards.configuration,
-            self.cards.sequence,
-            self.cards.taxa,
-            self.cards.pairs,
-            self.cards.rank,
-            self.cards.gaps,
-        ]:
-            self.binder.bind(object.properties.editable, card.setEnabled)
-
-        for card in [
-            self.cards.mdnc,
-            self.cards.rdns,
-        ]:
-            self.binder.bind(object.properties.editable, card.setContentsEnabled)
-            self.binder.bind(object.properties.editable, card.controls.title.setGray, lambda x: not x)
-
-        self.binder.bind(object.properties.busy, self.cards.progress.setBusy)
-        self.binder.bind(object.properties.has_logs, self.cards.progress.setVisible)
-        self.binder.bind(object.properties.done, self.cards.progress.setSuccess)
-
-        self.binder.bind(self.cards.progress.save, self.saveLog)
-        self.binder.bind(object.lineLogged, self.cards.progress.controls.logger.append)
-        self.binder.bind(object.clearLogs, self.handleClearLogs)
-        self.binder.bind(object.notification, self.showNotification)
-        # self.bind(object.progression, self.cards.progress.showProgress)
-
-        # self.binder.bind(object.properties.configuration_path, self.cards.configuration.setVisible, lambda path: path is not None)
-        self.binder.bind(object.properties.configuration_path, self.cards.configuration.setPath)
-        self.binder.bind(object.properties.sequence_path, self.cards.sequence.setPath)
-        self.binder.bind(object.properties.configuration_path, self.updateWindowTitle)
-        self.binder.bind(object.properties.sequence_path, self.updateWindowTitle)
-
-        self.binder.bind(self.cards.taxa.toggled, object.properties.taxon_mode)
-        self.binder.bind(object.properties.taxon_mode, self.cards.taxa.setMode)
-        self.binder.bind(self.cards.taxa.controls.list.textEditedSafe, object.properties.taxon_list)
-        self.binder.bind(object.properties.taxon_list, self.cards.taxa.controls.list.setText)
-
-        self.binder.bind(self.cards.pairs.toggled, object.properties.pairs_mode)
-        self.binder.bind(object.properties.pairs_mode, self.cards.pairs.setMode)
-        self.binder.bind(self.cards.pairs.controls.list.textEditedSafe, object.properties.pairs_list)
-        self.binder.bind(object.properties.pairs_list, self.cards.pairs.controls.list.setText)
-
-        self.binder.bind(self.cards.rank.toggled, object.properties.taxon_rank)
-        self.binder.bind(object.properties.taxon_rank, self.cards.rank.setRank)
-
-        self.binder.bind(self.cards.gaps.toggled, object.properties.gaps_as_characters)
-        self.binder.bind(object.properties.gaps_as_characters, self.cards.gaps.setMode)
-
-        self.binder.bind(self.cards.mdnc.controls.cutoff.textEditedSafe, object.mdnc.properties.cutoff)
-        self.binder.bind(object.mdnc.properties.cutoff, self.cards.mdnc.controls.cutoff.setText)
-
-        self.binder.bind(self.cards.mdnc.controls.nucleotides.textEditedSafe, object.mdnc.properties.nucleotides, lambda x: type_convert(x, int, None))
-        self.binder.bind(object.mdnc.properties.nucleotides, self.cards.mdnc.controls.nucleotides.setText, lambda x: str(x) if x is not None else '')
-
-        self.binder.bind(self.cards.mdnc.controls.iterations.textEditedSafe, object.mdnc.properties.iterations, lambda x: type_convert(x, int, None))
-        self.binder.bind(object.mdnc.properties.iterations, self.cards.mdnc.controls.iterations.setText, lambda x: str(x) if x is not None else '')
-
-        self.binder.bind(self.cards.mdnc.controls.max_length_raw.textEditedSafe, object.mdnc.properties.max_length_raw, lambda x: type_convert(x, int, None))
-        self.binder.bind(object.mdnc.properties.max_length_raw, self.cards.mdnc.controls.max_length_raw.setText, lambda x: str(x) if x is not None else '')
-
-        self.binder.bind(self.cards.mdnc.controls.max_length_refined.textEditedSafe, object.mdnc.properties.max_length_refined, lambda x: type_convert(x, int, None))
-        self.binder.bind(object.mdnc.properties.max_length_refined, self.cards.mdnc.controls.max_length_refined.setText, lambda x: str(x) if x is not None else '')
-
-        self.binder.bind(self.cards.mdnc.controls.indexing_reference.textEditedSafe, object.mdnc.properties.indexing_reference)
-        self.binder.bind(object.mdnc.properties.indexing_reference, self.cards.mdnc.controls.indexing_reference.setText)
-
-        self.binder.bind(self.cards.rdns.controls.p_diff.textEditedSafe, object.rdns.properties.p_diff, lambda x: type_convert(x, int, None))
-        self.binder.bind(object.rdns.properties.p_diff, self.cards.rdns.controls.p_diff.setText, lambda x: str(x) if x is not None else '')
-
-        self.binder.bind(self.cards.rdns.controls.n_max.textEditedSafe, object.rdns.properties.n_max, lambda x: type_convert(x, int, None))
-        self.binder.bind(object.rdns.properties.n_max, self.cards.rdns.controls.n_max.setText, lambda x: str(x) if x is not None else '')
-
-        self.binder.bind(self.cards.rdns.controls.scoring.valueChanged, object.rdns.properties.scoring)
-        self.binder.bind(object.rdns.properties.scoring, self.cards.rdns.controls.scoring.setValue)
-
-        self.binder.bind(object.properties.result_diagnosis, self.cards.diagnosis.setPath)
-        self.binder.bind(object.properties.result_pairwise, self.cards.pairwise.setPath)
-
-        self.binder.bind(self.cards.diagnosis.view, self.viewDiagnosis)
-        self.binder.bind(self.cards.diagnosis.save, self.saveDiagnosis)
-        self.binder.bind(self.cards.pairwise.view, self.viewPairwise)
-        self.binder.bind(self.cards.pairwise.save, self.savePairwise)
+        self.binder.bind_many(self._bindings_spec(object))
+        self._bind_contents(self.cards.mdnc, self._mdnc_bindings_spec)
+        self._bind_contents(self.cards.rdns, self._rdns_bindings_spec)
+
+    def _bind_contents(self, card, spec):
+        """Bind the contents of an expandable card now, or once they are drawn"""
+        if card.hasContents():
+            self.binder.bind_many(spec(self.object))
+        else:
+            self.binder.bind(card.contentsDrawn, lambda: self.binder.bind_many(spec(self.object)))
+
+    def _bindings_spec(self, object):
+        """List of (source, destination[, proxy]) tuples for binding the object"""
+        cards = self.cards
+        props = object.properties
+
+        return [
+            (cards.configuration.browse, self.openConfiguration),
+            (cards.sequence.browse, self.openSequence),
+
+            *((props.editable, card.setEnabled) for card in [
+                cards.configuration,
+                cards.sequence,
+                cards.taxa,
+                cards.pairs,
+                cards.rank,
+                cards.gaps,
+            ]),
+
+            *chain.from_iterable((
+                (props.editable, card.setContentsEnabled),
+                (props.editable, card.controls.title.setGray, _not),
+            ) for card in [
+                cards.mdnc,
+                cards.rdns,
+            ]),
+
+            (props.busy, cards.progress.setBusy),
+            (props.has_logs, cards.progress.setVisible),
+            (props.done, cards.progress.setSuccess),
+
+            (cards.progress.save, self.saveLog),
+            (object.lineLogged, cards.progress.appendLog),
+            (object.clearLogs, self.handleClearLogs),
+            (object.notification, self.showNotification),
+            # (object.progression, cards.progress.showProgress),
+
+            # (props.configuration_path, cards.configuration.setVisible, lambda path: path is not None),
+            (props.configuration_path, cards.configuration.setPath),
+            (props.sequence_path, cards.sequence.setPath),
+            (props.configuration_path, self.updateWindowTitle),
+            (props.sequence_path, self.updateWindowTitle),
+
+            (cards.taxa.toggled, props.taxon_mode),
+            (props.taxon_mode, cards.taxa.setMode),
+            (cards.taxa.listEdited, props.taxon_list),
+            (props.taxon_list, cards.taxa.setListText),
+
+            (cards.pairs.toggled, props.pairs_mode),
+            (props.pairs_mode, cards.pairs.setMode),
+            (cards.pairs.listEdited, props.pairs_list),
+            (props.pairs_list, cards.pairs.setListText),
+
+            (cards.rank.toggled, props.taxon_rank),
+            (props.taxon_rank, cards.rank.setRank),
+
+            (cards.gaps.toggled, props.gaps_as_characters),
+            (props.gaps_as_characters, cards.gaps.setMode),
+
+            (props.result_diagnosis, cards.diagnosis.setPath),
+            (props.result_pairwise, cards.pairwise.setPath),
+
+            (cards.diagnosis.view, self.viewDiagnosis),
+            (cards.diagnosis.save, self.saveDiagnosis),
+            (cards.pairwise.view, self.viewPairwise),
+            (cards.pairwise.save, self.savePairwise),
+        ]
+
+    def _mdnc_bindings_spec(self, object):
+        controls = self.cards.mdnc.controls
+        mdnc = object.mdnc.properties
+
+        return [
+            *_text_edit_bindings(controls.cutoff, mdnc.cutoff),
+            *_int_edit_bindings(controls.nucleotides, mdnc.nucleotides),
+            *_int_edit_bindings(controls.iterations, mdnc.iterations),
+            *_int_edit_bindings(controls.max_length_raw, mdnc.max_length_raw),
+            *_int_edit_bindings(controls.max_length_refined, mdnc.max_length_refined),
+            *_text_edit_bindings(controls.indexing_reference, mdnc.indexing_reference),
+        ]
+
+    def _rdns_bindings_spec(self, object):
+        controls = self.cards.rdns.controls
+        rdns = object.rdns.properties
+
+        return [
+            *_int_edit_bindings(controls.p_diff, rdns.p_diff),
+            *_int_edit_bindings(controls.n_max, rdns.n_max),
+
+            (controls.scoring.valueChanged, rdns.scoring),
+            (rdns.scoring, controls.scoring.setValue),
+        ]
 
     def updateWindowTitle(self):
+        """Coalesce title updates from both paths into one per event loop pass"""
+        if self._title_pending:
+            return
+        self._title_pending = True
+        QtCore.QTimer.singleShot(0, self._applyWindowTitle)
+
+    def _applyWindowTitle(self):
+        self._title_pending = False
         if self.object.configuration_path:
             filename = self.object.configuration_path.name
         elif self.object.sequence_path:
@@ -893,18 +1181,32 @@ class MoldView(TaskView):
         else:
             filename = None
 
-        title = f'{app.title} - {filename}' if filename else app.title
+        title = self._title_prefix + filename if filename else app.title
+        if title == self._last_title:
+            return
+        self._last_title = title
         self.window().setWindowTitle(title)
 
     def handleClearLogs(self):
-        self.cards.progress.controls.logger.clear()
-        self.parent().parent().verticalScrollBar().setValue(0)
+        self.cards.progress.clearLogs()
+        if self._scrollbar is None:
+            # The view is placed in its scroll area after construction
+            self._scrollbar = self.parent().parent().verticalScrollBar()
+        self._scrollbar.setValue(0)
 
     def open(self):
         path = self.getOpenPath('Open sequences or configuration file')
         if path is None:
             return
-        if is_fasta(path):
+        task = _SniffTask(path)
+        task.signals.done.connect(self.handleSniffed)
+        self._sniff_tasks.add(task)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def handleSniffed(self, task, fasta):
+        self._sniff_tasks.discard(task)
+        path = task.path
+        if fasta:
             self.object.open_sequence_path(path)
         else:
             self.object.open_configuration_path(path)
@@ -920,14 +1222,22 @@ class MoldView(TaskView):
             self.object.open_sequence_path(path)
 
     def viewDiagnosis(self, text, path):
-        dialog = ResultDialog(text, path, self.window())
-        dialog.save.connect(self.saveDiagnosis)
-        self.window().msgShow(dialog)
+        if self._diagnosis_dialog is None:
+            self._diagnosis_dialog = ResultDialog(text, path, self.window())
+            self._diagnosis_dialog.save.connect(self.saveDiagnosis)
+        else:
+            self._diagnosis_dialog.setText(text)
+            self._diagnosis_dialog.setPath(path)
+        self.window().msgShow(self._diagnosis_dialog)
 
     def viewPairwise(self, text, path):
-        dialog = ResultDialog(text, path, self.window())
-        dialog.save.connect(self.savePairwise)
-        self.window().msgShow(dialog)
+        if self._pairwise_dialog is None:
+            self._pairwise_dialog = ResultDialog(text, path, self.window())
+            self._pairwise_dialog.save.connect(self.savePairwise)
+        else:
+            self._pairwise_dialog.setText(text)
+            self._pairwise_dialog.setPath(path)
+        self.window().msgShow(self._pairwise_dialog)
 
     def saveDiagnosis(self):
         path = self.getSavePath('Save molecular diagnosis', str(self.object.suggested_diagnosis))
@@ -950,6 +1260,9 @@ class MoldView(TaskView):
             self.object.save_all(path)
 
     def start(self):
+        # Starting does not move focus, so pending edits must be committed here
+        for edit in self.findChildren(DebouncedIntEdit):
+            edit.flush()
         self.object.start()
 
     def stop(self):
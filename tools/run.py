@@ -5,8 +5,8 @@
 
 import multiprocessing
 
-from itaxotools.mold.gui import run
-
 if __name__ == "__main__":
     multiprocessing.freeze_support()
+
+    from itaxotools.mold.gui import run
     run()